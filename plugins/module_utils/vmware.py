@@ -1128,15 +1128,16 @@ class PyVmomi(object):
         elif api_type == 'HostAgent':
             return False
 
-    def get_managed_objects_properties(self, vim_type, properties=None):
+    def get_managed_objects_properties(self, vim_type, properties=None, folder=None):
         """
         Look up a Managed Object Reference in vCenter / ESXi Environment
         :param vim_type: Type of vim object e.g, for datacenter - vim.Datacenter
         :param properties: List of properties related to vim object e.g. Name
+        :param folder: Managed object to start the search from, defaults to the root folder
         :return: local content object
         """
         # Get Root Folder
-        root_folder = self.content.rootFolder
+        root_folder = folder or self.content.rootFolder
 
         if properties is None:
             properties = ['name']
@@ -1173,7 +1174,11 @@ class PyVmomi(object):
             reportMissingObjectsInResults=False
         )
 
-        return self.content.propertyCollector.RetrieveContents([filter_spec])
+        try:
+            return self.content.propertyCollector.RetrieveContents([filter_spec])
+        finally:
+            # The container view lives in the session on the server until it is destroyed
+            mor.Destroy()
 
     # Virtual Machine related functions
     def get_vm(self):
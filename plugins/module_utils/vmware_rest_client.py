@@ -47,6 +47,10 @@ from ansible.module_utils._text import to_native
 
 
 class VmwareRestClient(object):
+    # Number of connections to vCenter kept open for reuse, modules sending
+    # concurrent requests set it before connecting. Defaults to the SDK default of 8.
+    http_pool_maxsize = None
+
     def __init__(self, module):
         """
         Constructor
@@ -161,6 +165,13 @@ class VmwareRestClient(object):
         if client is None:
             self.module.fail_json(msg="Failed to login to %s" % hostname)
 
+        # The SDK mounts its own adapter with a pool of 8 connections on the
+        # session while creating the client, replace it afterwards
+        if self.http_pool_maxsize:
+            adapter = requests.adapters.HTTPAdapter(pool_maxsize=self.http_pool_maxsize)
+            session.mount('https://', adapter)
+            session.mount('http://', adapter)
+
         return client
 
     def get_tags_for_object(self, tag_service=None, tag_assoc_svc=None, dobj=None):
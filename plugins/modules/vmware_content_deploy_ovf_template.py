@@ -47,9 +47,50 @@ options:
     name:
       description:
       - The name of the VM to be deployed.
+      - The deployment fails if a VM with this name already exists in I(folder).
+        If I(datacenter) is nested in a folder, a VM with this name anywhere in the vCenter fails the deployment.
+      - One of I(name) or I(vms) is required.
+      - Mutually exclusive with I(vms).
       type: str
-      required: True
+      required: False
       aliases: ['vm_name']
+    vms:
+      description:
+      - List of virtual machines to deploy from the same template in one task.
+      - The lookups of the template and of the placement targets are done once and shared by all virtual machines,
+        the deployments themselves run concurrently.
+      - Per virtual machine, I(folder) and I(datastore) can be overridden, all other options apply to every virtual machine.
+      - If an empty list is given, nothing is deployed and the task reports no change.
+      - A virtual machine is not deployed if a VM with its name already exists in its folder.
+        If I(datacenter) is nested in a folder, a VM with its name anywhere in the vCenter prevents the deployment.
+      - Mutually exclusive with I(name).
+      type: list
+      elements: dict
+      required: False
+      version_added: '1.12.0'
+      suboptions:
+        name:
+          description:
+          - The name of the VM to be deployed.
+          type: str
+          required: True
+          aliases: ['vm_name']
+        folder:
+          description:
+          - Name of the folder in datacenter in which to place the deployed VM.
+          - If not specified, I(folder) is used.
+          type: str
+        datastore:
+          description:
+          - Name of the datastore to store the deployed VM and disk.
+          - If not specified, the datastore given by I(datastore) or I(datastore_cluster) is used.
+          type: str
+    max_workers:
+      description:
+      - The maximum number of virtual machines given by I(vms) to deploy concurrently.
+      type: int
+      default: 10
+      version_added: '1.12.0'
     datacenter:
       description:
       - Name of the datacenter, where VM to be deployed.
@@ -93,6 +134,15 @@ options:
       type: str
       default: 'thin'
       choices: [ thin, thick, eagerZeroedThick, eagerzeroedthick ]
+    include_annotation:
+      description:
+      - Whether to read the annotation of the OVF template before the deployment and set it explicitly on the deployed VM.
+      - If set to C(false), the OVF descriptor is not inspected before the deployment and vCenter applies the annotation
+        of the OVF package itself.
+      - The EULAs of the OVF template are always accepted, regardless of this option.
+      type: bool
+      default: false
+      version_added: '1.12.0'
 extends_documentation_fragment: community.vmware.vmware_rest_client.documentation
 '''
 
@@ -123,6 +173,24 @@ EXAMPLES = r'''
     resource_pool: test_rp
     storage_provisioning: eagerZeroedThick
   delegate_to: localhost
+
+- name: Deploy multiple Virtual Machines from OVF template in content library
+  community.vmware.vmware_content_deploy_ovf_template:
+    hostname: '{{ vcenter_hostname }}'
+    username: '{{ vcenter_username }}'
+    password: '{{ vcenter_password }}'
+    ovf_template: rhel_test_template
+    datastore: Shared_NFS_Volume
+    folder: vm
+    datacenter: Sample_DC_1
+    resource_pool: test_rp
+    vms:
+      - name: Sample_VM_1
+      - name: Sample_VM_2
+        folder: Sample_DC_1/vm/Sample_Folder
+      - name: Sample_VM_3
+        datastore: Local_Volume
+  delegate_to: localhost
 '''
 
 RETURN = r'''
@@ -134,12 +202,44 @@ vm_deploy_info:
         "msg": "Deployed Virtual Machine 'Sample_VM'.",
         "vm_id": "vm-1009"
     }
+vms_deploy_info:
+  description: Deployment message and vm_id of every virtual machine given by I(vms)
+  returned: when I(vms) is given
+  type: list
+  sample: [
+        {
+            "msg": "Deployed Virtual Machine 'Sample_VM_1'.",
+            "name": "Sample_VM_1",
+            "vm_id": "vm-1009"
+        },
+        {
+            "msg": "Deployed Virtual Machine 'Sample_VM_2'.",
+            "name": "Sample_VM_2",
+            "vm_id": "vm-1010"
+        }
+    ]
 '''
 
-from ansible.module_utils.basic import AnsibleModule, env_fallback
+import traceback
+
+from ansible.module_utils.basic import AnsibleModule, env_fallback, missing_required_lib
 from ansible.module_utils._text import to_native
+from ansible.module_utils.six.moves.urllib.parse import unquote
 from ansible_collections.community.vmware.plugins.module_utils.vmware_rest_client import VmwareRestClient
-from ansible_collections.community.vmware.plugins.module_utils.vmware import PyVmomi
+from ansible_collections.community.vmware.plugins.module_utils.vmware import PyVmomi, quote_obj_name
+
+try:
+    from pyVmomi import vim, vmodl
+except ImportError:
+    pass
+
+FUTURES_IMP_ERR = None
+try:
+    from concurrent.futures import ThreadPoolExecutor
+    HAS_FUTURES = True
+except ImportError:
+    FUTURES_IMP_ERR = traceback.format_exc()
+    HAS_FUTURES = False
 
 HAS_VAUTOMATION = False
 try:
@@ -153,6 +253,9 @@ except ImportError:
 class VmwareContentDeployOvfTemplate(VmwareRestClient):
     def __init__(self, module):
         """Constructor."""
+        # Keep a connection per concurrent deployment plus the library item lookup
+        if module.params['vms'] is not None:
+            self.http_pool_maxsize = module.params['max_workers'] + 1
         super(VmwareContentDeployOvfTemplate, self).__init__(module)
 
         # Initialize member variables
@@ -166,11 +269,12 @@ class VmwareContentDeployOvfTemplate(VmwareRestClient):
         self._host_id = None
         self._cluster_id = None
         self._resourcepool_id = None
+        self._folder_ids = {}
         self.result = {}
 
         # Turn on debug if not specified, but ANSIBLE_DEBUG is set
         if self.module._debug:
-            self.warn('Enable debug output because ANSIBLE_DEBUG was set.')
+            self.module.warn('Enable debug output because ANSIBLE_DEBUG was set.')
             self.params['log_level'] = 'debug'
         self.log_level = self.params['log_level']
         if self.log_level == 'debug':
@@ -181,6 +285,8 @@ class VmwareContentDeployOvfTemplate(VmwareRestClient):
         self.template = self.params.get('template')
         self.library = self.params.get('library')
         self.vm_name = self.params.get('name')
+        self.vms = self.params.get('vms')
+        self.max_workers = self.params.get('max_workers')
         self.datacenter = self.params.get('datacenter')
         self.datastore = self.params.get('datastore')
         self.datastore_cluster = self.params.get('datastore_cluster')
@@ -191,8 +297,18 @@ class VmwareContentDeployOvfTemplate(VmwareRestClient):
         self.storage_provisioning = self.params['storage_provisioning']
         if self.storage_provisioning == 'eagerzeroedthick':
             self.storage_provisioning = 'eagerZeroedThick'
-
-        vm = self._pyv.get_vm()
+        self.include_annotation = self.params['include_annotation']
+
+        if self.vms is not None and not HAS_FUTURES:
+            self.module.fail_json(msg=missing_required_lib('futures'),
+                                  exception=FUTURES_IMP_ERR)
+
+        # Existing virtual machines given by vms are reported per virtual machine
+        vm = None
+        if self.vm_name:
+            vm = self.find_vm_by_inventory_path(self.vm_name, self.folder)
+            if vm is None and not self.is_datacenter_in_root_folder():
+                vm = self._pyv.get_vm()
         if vm:
             self.result['vm_deploy_info'] = dict(
                 msg="Virtual Machine '%s' already Exists." % self.vm_name,
@@ -201,14 +317,33 @@ class VmwareContentDeployOvfTemplate(VmwareRestClient):
             self._fail(msg="Virtual Machine deployment failed")
 
     def deploy_vm_from_ovf_template(self):
+        # The library item lookup only needs the vAPI, so run it in the
+        # background while the inventory is searched
+        library_item_executor = None
+        if HAS_FUTURES:
+            library_item_executor = ThreadPoolExecutor(max_workers=1)
+            library_item_future = library_item_executor.submit(self.find_library_item_id)
+
         # Find the datacenter by the given datacenter name
         self._datacenter_id = self.get_datacenter_by_name(self.datacenter)
         if not self._datacenter_id:
             self._fail(msg="Failed to find the datacenter %s" % self.datacenter)
 
+        # Look up all placement targets within the datacenter at once
+        vim_types = {}
+        if self.datastore or self.datastore_cluster:
+            vim_types[vim.Datastore] = []
+        if self.host:
+            vim_types[vim.HostSystem] = []
+        if self.cluster:
+            vim_types[vim.ClusterComputeResource] = ['resourcePool']
+        if self.resourcepool and self.cluster and self.host:
+            vim_types[vim.ResourcePool] = ['owner']
+        placement_objects = self.get_placement_objects(vim_types)
+
         # Find the datastore by the given datastore name
         if self.datastore:
-            self._datastore_id = self.get_datastore_by_name(self.datacenter, self.datastore)
+            self._datastore_id = self.find_placement_id(placement_objects, vim.Datastore, self.datastore)
             if not self._datastore_id:
                 self._fail(msg="Failed to find the datastore %s" % self.datastore)
 
@@ -217,7 +352,7 @@ class VmwareContentDeployOvfTemplate(VmwareRestClient):
             dsc = self._pyv.find_datastore_cluster_by_name(self.datastore_cluster)
             if dsc:
                 self.datastore = self._pyv.get_recommended_datastore(dsc)
-                self._datastore_id = self.get_datastore_by_name(self.datacenter, self.datastore)
+                self._datastore_id = self.find_placement_id(placement_objects, vim.Datastore, self.datastore)
             else:
                 self._fail(msg="Failed to find the datastore cluster %s" % self.datastore_cluster)
 
@@ -225,78 +360,55 @@ class VmwareContentDeployOvfTemplate(VmwareRestClient):
             self._fail(msg="Failed to find the datastore using either datastore or datastore cluster")
 
         # Find the LibraryItem (Template) by the given LibraryItem name
-        if self.library:
-            self._library_item_id = self.get_library_item_from_content_library_name(
-                self.template, self.library
-            )
-            if not self._library_item_id:
-                self._fail(msg="Failed to find the library Item %s in content library %s" % (self.template, self.library))
+        if library_item_executor:
+            self._library_item_id = library_item_future.result()
+            library_item_executor.shutdown()
         else:
-            self._library_item_id = self.get_library_item_by_name(self.template)
-            if not self._library_item_id:
-                self._fail(msg="Failed to find the library Item %s" % self.template)
+            self._library_item_id = self.find_library_item_id()
+        if not self._library_item_id:
+            if self.library:
+                self._fail(msg="Failed to find the library Item %s in content library %s" % (self.template, self.library))
+            self._fail(msg="Failed to find the library Item %s" % self.template)
 
         # Find the folder by the given FQPN folder name
         # The FQPN is I(datacenter)/I(folder type)/folder name/... for
         # example Lab/vm/someparent/myfolder is a vm folder in the Lab datacenter.
-        folder_obj = self._pyv.find_folder_by_fqpn(self.folder, self.datacenter, folder_type='vm')
-        if folder_obj:
-            self._folder_id = folder_obj._moId
+        self._folder_id = self.find_folder_id(self.folder)
         if not self._folder_id:
             self._fail(msg="Failed to find the folder %s" % self.folder)
 
         # Find the Host by the given name
         if self.host:
-            self._host_id = self.get_host_by_name(self.datacenter, self.host)
+            self._host_id = self.find_placement_id(placement_objects, vim.HostSystem, self.host)
             if not self._host_id:
                 self._fail(msg="Failed to find the Host %s" % self.host)
 
         # Find the Cluster by the given Cluster name
         if self.cluster:
-            self._cluster_id = self.get_cluster_by_name(self.datacenter, self.cluster)
-            if not self._cluster_id:
+            cluster_obj, cluster_props = self.find_placement_object(placement_objects, vim.ClusterComputeResource, self.cluster)
+            if not cluster_obj:
                 self._fail(msg="Failed to find the Cluster %s" % self.cluster)
-            cluster_obj = self.api_client.vcenter.Cluster.get(self._cluster_id)
-            self._resourcepool_id = cluster_obj.resource_pool
+            self._cluster_id = cluster_obj._moId
+            self._resourcepool_id = cluster_props['resourcePool']._moId
 
         # Find the resourcepool by the given resourcepool name
         if self.resourcepool and self.cluster and self.host:
-            self._resourcepool_id = self.get_resource_pool_by_name(self.datacenter, self.resourcepool, self.cluster, self.host)
+            self._resourcepool_id = self.find_placement_id(placement_objects, vim.ResourcePool, self.resourcepool, owner_id=self._cluster_id)
             if not self._resourcepool_id:
                 self._fail(msg="Failed to find the resource_pool %s" % self.resourcepool)
 
         if not self._resourcepool_id:
             self._fail(msg="Failed to find a resource pool either by name or cluster")
 
-        deployment_target = LibraryItem.DeploymentTarget(
-            resource_pool_id=self._resourcepool_id,
-            folder_id=self._folder_id
-        )
-
-        self.ovf_summary = self.api_client.vcenter.ovf.LibraryItem.filter(
-            ovf_library_item_id=self._library_item_id,
-            target=deployment_target
-        )
-
-        self.deploy_spec = LibraryItem.ResourcePoolDeploymentSpec(
-            name=self.vm_name,
-            annotation=self.ovf_summary.annotation,
-            accept_all_eula=True,
-            network_mappings=None,
-            storage_mappings=None,
-            storage_provisioning=self.storage_provisioning,
-            storage_profile_id=None,
-            locale=None,
-            flags=None,
-            additional_parameters=None,
-            default_datastore_id=self._datastore_id
-        )
+        if self.vms is not None:
+            self.deploy_vms_from_ovf_template(placement_objects)
+            return
 
         response = {
             'succeeded': False
         }
         try:
-            response = self.api_client.vcenter.ovf.LibraryItem.deploy(self._library_item_id, deployment_target, self.deploy_spec)
+            response = self.deploy_library_item(self.vm_name, self._folder_id, self._datastore_id)
         except Error as error:
             self._fail(msg="%s" % self.get_error_message(error))
         except Exception as err:
@@ -315,6 +427,280 @@ class VmwareContentDeployOvfTemplate(VmwareRestClient):
         )
         self._exit()
 
+    def deploy_vms_from_ovf_template(self, placement_objects):
+        """
+        Deploy all virtual machines given by vms concurrently.
+        The datacenter, library item, host, cluster and resource pool are shared,
+        folder and datastore may be overridden per virtual machine.
+        """
+        # Virtual machines can only be looked up by their inventory path
+        # if the datacenter is not nested in a folder
+        datacenter_in_root_folder = self.is_datacenter_in_root_folder()
+        existing_vms = {}
+        if not datacenter_in_root_folder:
+            existing_vms = dict(
+                (unquote(vm_object.propSet[0].val), vm_object.obj)
+                for vm_object in self._pyv.get_managed_objects_properties(vim_type=vim.VirtualMachine, properties=['name'])
+                if len(vm_object.propSet) == 1
+            )
+
+        vms_deploy_info = []
+        deployments = []
+        for vm in self.vms:
+            vm_deploy_info = dict(name=vm['name'], vm_id='')
+            vms_deploy_info.append(vm_deploy_info)
+
+            if datacenter_in_root_folder:
+                existing_vm = self.find_vm_by_inventory_path(vm['name'], vm['folder'] or self.folder)
+            else:
+                existing_vm = existing_vms.get(vm['name'])
+            if existing_vm:
+                vm_deploy_info.update(
+                    msg="Virtual Machine '%s' already Exists." % vm['name'],
+                    vm_id=existing_vm._moId,
+                    failed=True,
+                )
+                continue
+
+            folder_id = self._folder_id
+            if vm['folder']:
+                folder_id = self.find_folder_id(vm['folder'])
+                if not folder_id:
+                    vm_deploy_info.update(msg="Failed to find the folder %s" % vm['folder'], failed=True)
+                    continue
+
+            datastore_id = self._datastore_id
+            if vm['datastore']:
+                datastore_id = self.find_placement_id(placement_objects, vim.Datastore, vm['datastore'])
+                if not datastore_id:
+                    vm_deploy_info.update(msg="Failed to find the datastore %s" % vm['datastore'], failed=True)
+                    continue
+
+            deployments.append((vm_deploy_info, folder_id, datastore_id))
+
+        if deployments:
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, len(deployments))) as executor:
+                futures = [
+                    (vm_deploy_info, executor.submit(self.deploy_library_item, vm_deploy_info['name'], folder_id, datastore_id))
+                    for vm_deploy_info, folder_id, datastore_id in deployments
+                ]
+                for vm_deploy_info, future in futures:
+                    try:
+                        response = future.result()
+                    except Error as error:
+                        vm_deploy_info.update(msg=self.get_error_message(error), failed=True)
+                        continue
+                    except Exception as err:
+                        vm_deploy_info.update(msg=to_native(err), failed=True)
+                        continue
+
+                    if not response.succeeded:
+                        vm_deploy_info.update(msg="Virtual Machine deployment failed", failed=True)
+                        continue
+                    self.result['changed'] = True
+                    vm_deploy_info.update(
+                        msg="Deployed Virtual Machine '%s'." % vm_deploy_info['name'],
+                        vm_id=response.resource_id.id,
+                    )
+
+        self.result['vms_deploy_info'] = vms_deploy_info
+        failed_vms = [vm_deploy_info['name'] for vm_deploy_info in vms_deploy_info if vm_deploy_info.get('failed')]
+        if failed_vms:
+            self._fail(msg="Virtual Machine deployment failed for %s" % ", ".join(failed_vms))
+        self._exit()
+
+    def is_datacenter_in_root_folder(self):
+        """
+        Check if the datacenter is placed directly in the root folder,
+        so objects within it can be looked up by their inventory path.
+
+        Returns: True if the datacenter is found in the root folder, else False
+
+        """
+        datacenter_obj = self._pyv.content.searchIndex.FindByInventoryPath(quote_obj_name(self.datacenter))
+        return isinstance(datacenter_obj, vim.Datacenter)
+
+    def find_vm_by_inventory_path(self, vm_name, folder):
+        """
+        Find the virtual machine in the given vm folder by its inventory path,
+        without searching the inventory.
+        Args:
+            vm_name: Name of the virtual machine
+            folder: FQPN of the vm folder, see find_folder_by_fqpn
+
+        Returns: virtual machine object if found, else None
+
+        """
+        folder_parts = [part for part in folder.split('/') if part]
+        if folder_parts and folder_parts[0] == self.datacenter:
+            folder_parts.pop(0)
+        if folder_parts and folder_parts[0] == 'vm':
+            folder_parts.pop(0)
+
+        # Names are stored with '%', '/' and backslash escaped, a raw '/' would
+        # be taken as a path separator and resolve to a different object.
+        # The folder parts are already split at '/' like in find_folder_by_fqpn.
+        inventory_path = '/'.join([quote_obj_name(self.datacenter), 'vm'] + folder_parts + [quote_obj_name(vm_name)])
+        vm_obj = self._pyv.content.searchIndex.FindByInventoryPath(inventory_path)
+        if isinstance(vm_obj, vim.VirtualMachine):
+            return vm_obj
+        return None
+
+    def find_library_item_id(self):
+        """
+        Find the identifier of the library item given by template,
+        within the content library given by library if specified.
+
+        Returns: Identifier of the library item if found, else None
+
+        """
+        if self.library:
+            return self.get_library_item_from_content_library_name(self.template, self.library)
+        return self.get_library_item_by_name(self.template)
+
+    def find_folder_id(self, folder):
+        """
+        Find the identifier of the vm folder by its FQPN.
+        Virtual machines given by vms commonly share folders,
+        so every folder is only looked up once.
+        Args:
+            folder: FQPN of the folder
+
+        Returns: Identifier of the folder if found, else None
+
+        """
+        if folder not in self._folder_ids:
+            folder_obj = self._pyv.find_folder_by_fqpn(folder, self.datacenter, folder_type='vm')
+            self._folder_ids[folder] = folder_obj._moId if folder_obj else None
+        return self._folder_ids[folder]
+
+    def deploy_library_item(self, vm_name, folder_id, datastore_id):
+        """
+        Deploy a virtual machine from the library item
+        Args:
+            vm_name: Name of the virtual machine
+            folder_id: Identifier of the folder to place the virtual machine in
+            datastore_id: Identifier of the default datastore of the virtual machine
+
+        Returns: Deployment result
+
+        """
+        deployment_target = LibraryItem.DeploymentTarget(
+            resource_pool_id=self._resourcepool_id,
+            folder_id=folder_id
+        )
+
+        annotation = None
+        if self.include_annotation:
+            ovf_summary = self.api_client.vcenter.ovf.LibraryItem.filter(
+                ovf_library_item_id=self._library_item_id,
+                target=deployment_target
+            )
+            annotation = ovf_summary.annotation
+
+        deploy_spec = LibraryItem.ResourcePoolDeploymentSpec(
+            name=vm_name,
+            annotation=annotation,
+            accept_all_eula=True,
+            network_mappings=None,
+            storage_mappings=None,
+            storage_provisioning=self.storage_provisioning,
+            storage_profile_id=None,
+            locale=None,
+            flags=None,
+            additional_parameters=None,
+            default_datastore_id=datastore_id
+        )
+
+        return self.api_client.vcenter.ovf.LibraryItem.deploy(self._library_item_id, deployment_target, deploy_spec)
+
+    def get_placement_objects(self, vim_types):
+        """
+        Retrieve the objects of the given types within the datacenter
+        with a single property collector call.
+        Args:
+            vim_types: Dict of vim type and list of properties to retrieve in addition to the name
+
+        Returns: List of tuples of managed object and dict of its retrieved properties
+
+        """
+        if not vim_types:
+            return []
+
+        datacenter_obj = vim.Datacenter(self._datacenter_id, self._pyv.si._stub)
+        content = self._pyv.content
+        container = content.viewManager.CreateContainerView(datacenter_obj, list(vim_types), True)
+
+        traversal_spec = vmodl.query.PropertyCollector.TraversalSpec(
+            name="traversal_spec",
+            path='view',
+            skip=False,
+            type=vim.view.ContainerView
+        )
+        object_spec = vmodl.query.PropertyCollector.ObjectSpec(
+            obj=container,
+            skip=True,
+            selectSet=[traversal_spec]
+        )
+        property_specs = [
+            vmodl.query.PropertyCollector.PropertySpec(
+                type=vim_type,
+                all=False,
+                pathSet=['name'] + properties
+            ) for vim_type, properties in vim_types.items()
+        ]
+        filter_spec = vmodl.query.PropertyCollector.FilterSpec(
+            objectSet=[object_spec],
+            propSet=property_specs,
+            reportMissingObjectsInResults=False
+        )
+
+        try:
+            object_contents = content.propertyCollector.RetrieveContents([filter_spec])
+        finally:
+            container.Destroy()
+
+        return [
+            (object_content.obj, dict((prop.name, prop.val) for prop in object_content.propSet))
+            for object_content in object_contents
+        ]
+
+    @staticmethod
+    def find_placement_object(placement_objects, vim_type, name, owner_id=None):
+        """
+        Find the object of the given type and name
+        Args:
+            placement_objects: List returned by get_placement_objects
+            vim_type: Type of vim object e.g, for datastore - vim.Datastore
+            name: Name of the object
+            owner_id: Managed object ID of the owner the object has to belong to, if given
+
+        Returns: Tuple of managed object and dict of its retrieved properties if found, else (None, {})
+
+        """
+        for obj, props in placement_objects:
+            if not isinstance(obj, vim_type) or unquote(props.get('name', '')) != name:
+                continue
+            if owner_id and (not props.get('owner') or props['owner']._moId != owner_id):
+                continue
+            return obj, props
+        return None, {}
+
+    def find_placement_id(self, placement_objects, vim_type, name, owner_id=None):
+        """
+        Find the identifier of the object of the given type and name
+        Args:
+            placement_objects: List returned by get_placement_objects
+            vim_type: Type of vim object e.g, for datastore - vim.Datastore
+            name: Name of the object
+            owner_id: Managed object ID of the owner the object has to belong to, if given
+
+        Returns: Managed object ID if found, else None
+
+        """
+        obj, dummy = self.find_placement_object(placement_objects, vim_type, name, owner_id=owner_id)
+        return obj._moId if obj else None
+
     #
     # Wrap AnsibleModule methods
     #
@@ -376,7 +762,33 @@ def main():
             aliases=[
                 'vm_name'
             ],
-            required=True
+            required=False
+        ),
+        vms=dict(
+            type='list',
+            elements='dict',
+            options=dict(
+                name=dict(
+                    type='str',
+                    aliases=[
+                        'vm_name'
+                    ],
+                    required=True
+                ),
+                folder=dict(
+                    type='str',
+                    required=False
+                ),
+                datastore=dict(
+                    type='str',
+                    required=False
+                ),
+            ),
+            required=False
+        ),
+        max_workers=dict(
+            type='int',
+            default=10
         ),
         datacenter=dict(
             type='str',
@@ -420,6 +832,10 @@ def main():
                 ['VMWARE_STORAGE_PROVISIONING']
             )
         ),
+        include_annotation=dict(
+            type='bool',
+            default=False
+        ),
     )
     module = AnsibleModule(
         argument_spec=argument_spec,
@@ -427,18 +843,35 @@ def main():
         required_one_of=[
             ['datastore', 'datastore_cluster'],
             ['host', 'cluster'],
+            ['name', 'vms'],
+        ],
+        mutually_exclusive=[
+            ['name', 'vms'],
         ],
     )
 
+    if module.params['max_workers'] < 1:
+        module.fail_json(msg="max_workers must be at least 1")
+
     result = {'failed': False, 'changed': False}
-    vmware_contentlib_create = VmwareContentDeployOvfTemplate(module)
+    if module.params['vms'] is not None and not module.params['vms']:
+        # An empty list of virtual machines, e.g. from a template, is a no-op
+        result.update(vms_deploy_info=[])
+        module.exit_json(**result)
+
     if module.check_mode:
+        # Report the desired operation without connecting to vCenter
         result.update(
-            vm_name=module.params['name'],
             changed=True,
             desired_operation='Create VM with PowerOff State',
         )
+        if module.params['vms'] is not None:
+            result.update(vm_names=[vm['name'] for vm in module.params['vms']])
+        else:
+            result.update(vm_name=module.params['name'])
         module.exit_json(**result)
+
+    vmware_contentlib_create = VmwareContentDeployOvfTemplate(module)
     vmware_contentlib_create.deploy_vm_from_ovf_template()
 
 
@@ -36,6 +36,7 @@ options:
   object_name:
     description:
     - The object name to assigned permission.
+    - One of I(object_name) or I(moid) is required.
     - Mutually exclusive with I(moid).
     type: str
   object_type:
@@ -49,9 +50,20 @@ options:
   moid:
     description:
     - Managed object ID for the given object.
+    - One of I(object_name) or I(moid) is required.
     - Mutually exclusive with I(object_name).
     aliases: ['object_moid']
     type: 'str'
+  datacenter:
+    description:
+    - The name of the datacenter in which to search for the object given by I(object_name).
+    - If specified, only the inventory of this datacenter is searched instead of the whole vCenter inventory.
+    - Objects placed directly in the vm, host, datastore or network folder of the datacenter are looked up by their inventory path
+      without searching the inventory at all. For folders, only the vm folder is checked this way.
+    - Ignored if I(moid) is specified or if I(object_type) is C(Datacenter).
+    type: str
+    required: False
+    version_added: '1.12.0'
 extends_documentation_fragment:
 - community.vmware.vmware.documentation
 version_added: "1.11.0"
@@ -76,6 +88,16 @@ EXAMPLES = r"""
     principal: some.user@company.com
     object_name: ds_200
     object_type: Datastore
+
+- name: Gather role information about Virtual Machine in the given datacenter
+  community.vmware.vmware_object_role_permission_info:
+    hostname: "{{ vcenter_hostname }}"
+    username: "{{ vcenter_username }}"
+    password: "{{ vcenter_password }}"
+    validate_certs: false
+    datacenter: DC0
+    object_name: vm_200
+    object_type: VirtualMachine
 """
 
 RETURN = r"""
@@ -94,17 +116,50 @@ permission_info:
 """
 
 try:
-    from pyVmomi import vim
+    from pyVmomi import vim, vmodl
+
+    # Managed object classes of the supported object types
+    VIM_TYPES = dict(
+        (object_type, getattr(vim, object_type)) for object_type in (
+            "Folder",
+            "VirtualMachine",
+            "Datacenter",
+            "ResourcePool",
+            "Datastore",
+            "Network",
+            "HostSystem",
+            "ComputeResource",
+            "ClusterComputeResource",
+            "DistributedVirtualSwitch",
+        )
+    )
 except ImportError:
     pass
 
 from ansible.module_utils.basic import AnsibleModule
+from ansible.module_utils._text import to_text
+from ansible.module_utils.six.moves.urllib.parse import unquote
 from ansible_collections.community.vmware.plugins.module_utils.vmware import (
     PyVmomi,
     vmware_argument_spec,
-    find_obj,
+    find_datacenter_by_name,
+    quote_obj_name,
 )
 
+# Inventory paths, relative to the datacenter, of objects placed directly
+# in the datacenter's vm, host, datastore or network folder. Folders are only
+# probed in the vm folder, the other places are left to the inventory search.
+INVENTORY_PATHS = {
+    "Folder": ["vm/{0}"],
+    "VirtualMachine": ["vm/{0}"],
+    "Datastore": ["datastore/{0}"],
+    "Network": ["network/{0}"],
+    "DistributedVirtualSwitch": ["network/{0}"],
+    "HostSystem": ["host/{0}/{0}"],
+    "ComputeResource": ["host/{0}"],
+    "ClusterComputeResource": ["host/{0}"],
+}
+
 
 class VMwareObjectRolePermission(PyVmomi):
     def __init__(self, module):
@@ -117,7 +172,8 @@ class VMwareObjectRolePermission(PyVmomi):
         self.principal = self.params.get('principal')
         self.get_object()
         self.get_perms()
-        self.populate_role_list()
+        if self.principal is None:
+            self.populate_role_list()
         self.populate_permission_list()
 
     def populate_permission_list(self):
@@ -133,7 +189,18 @@ class VMwareObjectRolePermission(PyVmomi):
                     }
                 )
         else:
-            results = self.to_json(self.current_perms)
+            # Same layout as the JSON serialization of the UserPrivilegeResult objects
+            for user_privilege in self.current_perms:
+                results.append(
+                    {
+                        "_vimtype": user_privilege.__class__.__name__,
+                        "entity": "%s:%s" % (
+                            user_privilege.entity.__class__.__name__,
+                            user_privilege.entity._moId,
+                        ),
+                        "privileges": list(user_privilege.privileges),
+                    }
+                )
         self.module.exit_json(changed=False, permission_info=results)
 
     def populate_role_list(self):
@@ -170,63 +237,122 @@ class VMwareObjectRolePermission(PyVmomi):
             "VirtualMachineConsoleUser": ["Virtual Machine console user"],
             "InventoryService.Tagging.TaggingAdmin": ["Tagging Admin"],
         }
-        for role in self.content.authorizationManager.roleList:
+        for role in self.auth_manager.roleList:
             self.role_list[role.roleId] = role.name
             if user_friendly_role_names.get(role.name):
                 for role_name in user_friendly_role_names[role.name]:
                     self.role_list[role.roleId] = role_name
 
     def get_perms(self):
-        if self.principal is None:
-            self.current_perms = self.auth_manager.RetrieveEntityPermissions(
-                self.current_obj, True
-            )
-        else:
-            moid_list = []
-            moid_list.append(self.current_obj)
-            self.current_perms = self.auth_manager.FetchUserPrivilegeOnEntities(
-                moid_list, self.principal
-            )
+        # The object may have been removed after it was found,
+        # or the given moid may not exist at all
+        try:
+            if self.principal is None:
+                self.current_perms = self.auth_manager.RetrieveEntityPermissions(
+                    self.current_obj, True
+                )
+            else:
+                moid_list = []
+                moid_list.append(self.current_obj)
+                self.current_perms = self.auth_manager.FetchUserPrivilegeOnEntities(
+                    moid_list, self.principal
+                )
+        except vmodl.fault.ManagedObjectNotFound:
+            self.fail_object_not_found()
 
     def get_object(self):
-        # find_obj doesn't include rootFolder
+        vim_type = VIM_TYPES.get(self.params["object_type"])
+        if not vim_type:
+            self.module.fail_json(
+                msg="Object type %s is not valid." % self.params["object_type"]
+            )
+
+        # The managed object can be referenced by its moid without any lookup
+        if self.params["moid"]:
+            self.current_obj = vim_type(self.params["moid"], self.si._stub)
+            return
+
+        # The container view doesn't include rootFolder
         if (
             self.params["object_type"] == "Folder" and self.params["object_name"] == "rootFolder"
         ):
             self.current_obj = self.content.rootFolder
             return
 
-        vim_type = None
-        try:
-            vim_type = getattr(vim, self.params["object_type"])
-        except AttributeError:
-            pass
-        if not vim_type:
-            self.module.fail_json(
-                msg="Object type %s is not valid." % self.params["object_type"]
-            )
+        self.current_obj = self.find_object_by_inventory_path(vim_type)
+        if self.current_obj is not None:
+            return
 
-        msg = "Specified object "
-        if "moid" in self.params and self.params["moid"]:
-            self.current_obj = vim_type(self.params["moid"], self.si._stub)
-            msg += "with moid %s of type %s" % (
+        # Limit the search to the given datacenter
+        folder = None
+        if self.params["datacenter"] and self.params["object_type"] != "Datacenter":
+            folder = find_datacenter_by_name(self.content, self.params["datacenter"])
+            if folder is None:
+                self.module.fail_json(
+                    msg="Datacenter %s was not found" % self.params["datacenter"]
+                )
+        # Fetch the names of all candidates with a single property collector call
+        # instead of reading the name of every object one by one
+        objects = self.get_managed_objects_properties(
+            vim_type=vim_type,
+            properties=["name"],
+            folder=folder,
+        )
+        object_name = to_text(unquote(self.params["object_name"]))
+        for temp_object in objects:
+            if (
+                len(temp_object.propSet) == 1
+                and to_text(unquote(temp_object.propSet[0].val)) == object_name
+            ):
+                self.current_obj = temp_object.obj
+                break
+
+        if self.current_obj is None:
+            self.fail_object_not_found()
+
+    def fail_object_not_found(self):
+        if self.params["moid"]:
+            msg = "Specified object with moid %s of type %s was not found" % (
                 self.params["moid"],
                 self.params["object_type"],
             )
-        elif "object_name" in self.params and self.params["object_name"]:
-            self.current_obj = find_obj(
-                content=self.content,
-                vimtype=[vim_type],
-                name=self.params["object_name"],
-            )
-            msg = "%s of type %s" % (
+        else:
+            msg = "Specified object %s of type %s was not found" % (
                 self.params["object_name"],
                 self.params["object_type"],
             )
+        self.module.fail_json(msg=msg)
 
-        if self.current_obj is None:
-            msg += "was not found"
-            self.module.fail_json(msg=msg)
+    def find_object_by_inventory_path(self, vim_type):
+        """
+        Find the object by its inventory path without searching the inventory.
+        Only datacenters and objects placed directly in the vm, host, datastore
+        or network folder of the given datacenter can be found this way.
+
+        Args:
+            vim_type: Type of vim object e.g, for datastore - vim.Datastore
+
+        Returns: managed object if found, else None
+
+        """
+        # Names are stored with '%', '/' and backslash escaped, a raw '/' would
+        # be taken as a path separator and resolve to a different object
+        object_name = quote_obj_name(self.params["object_name"])
+        if self.params["object_type"] == "Datacenter":
+            paths = [object_name]
+        elif self.params["datacenter"]:
+            paths = [
+                "%s/%s" % (quote_obj_name(self.params["datacenter"]), path.format(object_name))
+                for path in INVENTORY_PATHS.get(self.params["object_type"], [])
+            ]
+        else:
+            return None
+
+        for path in paths:
+            obj = self.content.searchIndex.FindByInventoryPath(path)
+            if isinstance(obj, vim_type):
+                return obj
+        return None
 
 
 def main():
@@ -258,6 +384,10 @@ def main():
                 type="str",
                 aliases=["object_moid"],
             ),
+            datacenter=dict(
+                type="str",
+                required=False
+            ),
         )
     )
 